@@ -26,7 +26,7 @@ from pandas.api.types import (  # type: ignore[attr-defined]
 
 from pyspark.pandas.internal import InternalField
 from pyspark.pandas.spark import functions as SF
-from pyspark.pandas.data_type_ops.categorical_ops import _to_cat
+from pyspark.pandas.data_type_ops.categorical_ops import _remap_codes, _to_cat
 from pyspark.sql import functions as F
 from pyspark.sql.types import StructField
 
@@ -243,16 +243,19 @@ class CategoricalAccessor:
                 FutureWarning,
             )
 
+        dtype = self._dtype
+        old_categories = dtype.categories
+
         categories: List[Any]
         if is_list_like(new_categories):
             categories = list(new_categories)
         else:
             categories = [new_categories]
 
-        if any(cat in self.categories for cat in categories):
+        if any(cat in old_categories for cat in categories):
             raise ValueError(
                 "new categories must not include old categories: {{{cats}}}".format(
-                    cats=", ".join(set(str(cat) for cat in categories if cat in self.categories))
+                    cats=", ".join(set(str(cat) for cat in categories if cat in old_categories))
                 )
             )
 
@@ -260,7 +263,7 @@ class CategoricalAccessor:
             self._data._column_label,
             self._data.spark.column,
             field=self._data._internal.data_fields[0].copy(
-                dtype=CategoricalDtype(list(self.categories) + categories, ordered=self.ordered)
+                dtype=CategoricalDtype(list(old_categories) + categories, ordered=dtype.ordered)
             ),
         )
         if inplace:
@@ -272,7 +275,8 @@ class CategoricalAccessor:
     def _set_ordered(self, *, ordered: bool, inplace: bool) -> Optional["ps.Series"]:
         from pyspark.pandas.frame import DataFrame
 
-        if self.ordered == ordered:
+        dtype = self._dtype
+        if dtype.ordered == ordered:
             if inplace:
                 return None
             else:
@@ -282,7 +286,7 @@ class CategoricalAccessor:
                 self._data._column_label,
                 self._data.spark.column,
                 field=self._data._internal.data_fields[0].copy(
-                    dtype=CategoricalDtype(categories=self.categories, ordered=ordered)
+                    dtype=CategoricalDtype(categories=dtype.categories, ordered=ordered)
                 ),
             )
             if inplace:
@@ -438,6 +442,9 @@ class CategoricalAccessor:
                 FutureWarning,
             )
 
+        old_dtype = self._dtype
+        old_categories = old_dtype.categories
+
         categories: List[Any]
         if is_list_like(removals):
             categories = [cat for cat in removals if cat is not None]
@@ -446,11 +453,11 @@ class CategoricalAccessor:
         else:
             categories = [removals]
 
-        if any(cat not in self.categories for cat in categories):
+        if any(cat not in old_categories for cat in categories):
             raise ValueError(
                 "removals must all be in old categories: {{{cats}}}".format(
                     cats=", ".join(
-                        set(str(cat) for cat in categories if cat not in self.categories)
+                        set(str(cat) for cat in categories if cat not in old_categories)
                     )
                 )
             )
@@ -462,9 +469,9 @@ class CategoricalAccessor:
                 return self._data.copy()
         else:
             dtype = CategoricalDtype(
-                [cat for cat in self.categories if cat not in categories], ordered=self.ordered
+                [cat for cat in old_categories if cat not in categories], ordered=old_dtype.ordered
             )
-            psser = self._data.astype(dtype)
+            psser = _remap_codes(self._data, dtype)
 
             if inplace:
                 internal = self._data._psdf._internal.with_new_spark_column(
@@ -622,12 +629,16 @@ class CategoricalAccessor:
                 FutureWarning,
             )
 
+        dtype = self._dtype
+        old_categories = dtype.categories
+
         if is_dict_like(new_categories):
-            categories = [cast(dict, new_categories).get(item, item) for item in self.categories]
+            get = cast(dict, new_categories).get
+            categories = [get(item, item) for item in old_categories.tolist()]
         elif callable(new_categories):
-            categories = [new_categories(item) for item in self.categories]
+            categories = [new_categories(item) for item in old_categories]
         elif is_list_like(new_categories):
-            if len(self.categories) != len(new_categories):
+            if len(old_categories) != len(new_categories):
                 raise ValueError(
                     "new categories need to have the same number of items as the old categories!"
                 )
@@ -639,7 +650,7 @@ class CategoricalAccessor:
             self._data._column_label,
             self._data.spark.column,
             field=self._data._internal.data_fields[0].copy(
-                dtype=CategoricalDtype(categories=categories, ordered=self.ordered)
+                dtype=CategoricalDtype(categories=categories, ordered=dtype.ordered)
             ),
         )
 
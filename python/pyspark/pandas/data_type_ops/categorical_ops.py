@@ -42,17 +42,17 @@ class CategoricalOps(DataTypeOps):
 
     def restore(self, col: pd.Series) -> pd.Series:
         """Restore column when to_pandas."""
-        return pd.Series(
-            pd.Categorical.from_codes(
-                col.replace(np.nan, -1).astype(int),
-                categories=cast(CategoricalDtype, self.dtype).categories,
-                ordered=cast(CategoricalDtype, self.dtype).ordered,
-            )
-        )
+        if col.dtype.kind == "i":
+            # Non-nullable codes already arrive as integers; no need to fill or cast them.
+            codes = col.to_numpy()
+        else:
+            codes = col.replace(np.nan, -1).astype(int)
+        return pd.Series(pd.Categorical.from_codes(codes, dtype=cast(CategoricalDtype, self.dtype)))
 
     def prepare(self, col: pd.Series) -> pd.Series:
         """Prepare column when from_pandas."""
-        return col.cat.codes
+        codes = cast(pd.Categorical, col.array).codes
+        return pd.Series(codes, index=col.index, name=col.name, copy=False)
 
     def astype(self, index_ops: IndexOpsLike, dtype: Union[str, type, Dtype]) -> IndexOpsLike:
         dtype, _ = pandas_on_spark_type(dtype)
@@ -140,3 +140,28 @@ def _to_cat(index_ops: IndexOpsLike) -> IndexOpsLike:
         map_scol = F.create_map(*kvs)
         scol = map_scol[index_ops.spark.column]
     return index_ops._with_new_scol(scol)
+
+
+def _remap_codes(index_ops: IndexOpsLike, dtype: CategoricalDtype) -> IndexOpsLike:
+    """
+    Remap the codes of a Categorical operand to the categories of the given `dtype`.
+
+    Codes whose category is not in `dtype` become -1.
+    """
+    new_codes = {category: code for code, category in enumerate(dtype.categories)}
+    categories = cast(CategoricalDtype, index_ops.dtype).categories
+    if len(categories) == 0:
+        scol = SF.lit(-1)
+    else:
+        kvs = chain(
+            *[
+                (SF.lit(code), SF.lit(new_codes.get(category, -1)))
+                for code, category in enumerate(categories)
+            ]
+        )
+        map_scol = F.create_map(*kvs)
+        scol = F.coalesce(map_scol[index_ops.spark.column], SF.lit(-1))
+    return index_ops._with_new_scol(
+        scol.cast(index_ops.spark.data_type),
+        field=index_ops._internal.data_fields[0].copy(dtype=dtype, nullable=False),
+    )
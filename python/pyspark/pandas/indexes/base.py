@@ -2667,11 +2667,12 @@ class Index(IndexOpsMixin):
         return lib.infer_dtype([self.to_series().head(1).item()])
 
     def __getattr__(self, item: str) -> Any:
-        if hasattr(MissingPandasLikeIndex, item):
-            property_or_func = getattr(MissingPandasLikeIndex, item)
+        # Private and dunder probes, e.g., from IPython, are never missing pandas APIs.
+        if not item.startswith("_"):
+            property_or_func = getattr(MissingPandasLikeIndex, item, None)
             if isinstance(property_or_func, property):
                 return property_or_func.fget(self)
-            else:
+            elif property_or_func is not None:
                 return partial(property_or_func, self)
         raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, item))
 
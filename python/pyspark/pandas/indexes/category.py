@@ -99,7 +99,7 @@ class CategoricalIndex(Index):
 
     @no_type_check
     def __new__(cls, data=None, categories=None, ordered=None, dtype=None, copy=False, name=None):
-        if not is_hashable(name):
+        if name is not None and not is_hashable(name):
             raise TypeError("Index.name must be a hashable type")
 
         if isinstance(data, (Series, Index)):
@@ -143,14 +143,11 @@ class CategoricalIndex(Index):
         >>> idx.codes
         Int64Index([0, 1, 1, 2, 2, 2], dtype='int64')
         """
+        internal = self._psdf._internal
         return self._with_new_scol(
-            self.spark.column,
+            internal.index_spark_columns[0],
             field=InternalField.from_struct_field(
-                StructField(
-                    name=self._internal.index_spark_column_names[0],
-                    dataType=self.spark.data_type,
-                    nullable=self.spark.nullable,
-                )
+                cast(StructField, internal.index_fields[0].struct_field)
             ),
         ).rename(None)
 
@@ -173,13 +170,19 @@ class CategoricalIndex(Index):
 
     @categories.setter
     def categories(self, categories: Union[pd.Index, List]) -> None:
-        dtype = CategoricalDtype(categories, ordered=self.ordered)
+        old_dtype = self.dtype
+        dtype = CategoricalDtype(categories, ordered=old_dtype.ordered)
 
-        if len(self.categories) != len(dtype.categories):
+        if len(old_dtype.categories) != len(dtype.categories):
             raise ValueError(
                 "new categories need to have the same number of items as the old categories!"
             )
 
+        if old_dtype.categories.equals(dtype.categories) and (
+            old_dtype.categories.dtype == dtype.categories.dtype
+        ):
+            return
+
         internal = self._psdf._internal.copy(
             index_fields=[self._internal.index_fields[0].copy(dtype=dtype)]
         )
@@ -254,9 +257,7 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(
-            self.to_series().cat.add_categories(new_categories=new_categories)
-        ).rename(self.name)
+        return cast(CategoricalIndex, Index(self.to_series().cat.add_categories(new_categories)))
 
     def as_ordered(self, inplace: bool = False) -> Optional["CategoricalIndex"]:
         """
@@ -287,7 +288,7 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(self.to_series().cat.as_ordered()).rename(self.name)
+        return cast(CategoricalIndex, Index(self.to_series().cat.as_ordered()))
 
     def as_unordered(self, inplace: bool = False) -> Optional["CategoricalIndex"]:
         """
@@ -318,7 +319,7 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(self.to_series().cat.as_unordered()).rename(self.name)
+        return cast(CategoricalIndex, Index(self.to_series().cat.as_unordered()))
 
     def remove_categories(
         self, removals: Union[pd.Index, Any, List], inplace: bool = False
@@ -371,7 +372,7 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(self.to_series().cat.remove_categories(removals)).rename(self.name)
+        return cast(CategoricalIndex, Index(self.to_series().cat.remove_categories(removals)))
 
     def remove_unused_categories(self, inplace: bool = False) -> Optional["CategoricalIndex"]:
         """
@@ -412,7 +413,7 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(self.to_series().cat.remove_unused_categories()).rename(self.name)
+        return cast(CategoricalIndex, Index(self.to_series().cat.remove_unused_categories()))
 
     def rename_categories(
         self, new_categories: Union[list, dict, Callable], inplace: bool = False
@@ -482,9 +483,7 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(self.to_series().cat.rename_categories(new_categories)).rename(
-            self.name
-        )
+        return cast(CategoricalIndex, Index(self.to_series().cat.rename_categories(new_categories)))
 
     def reorder_categories(
         self,
@@ -544,9 +543,14 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(
-            self.to_series().cat.reorder_categories(new_categories=new_categories, ordered=ordered)
-        ).rename(self.name)
+        return cast(
+            CategoricalIndex,
+            Index(
+                self.to_series().cat.reorder_categories(
+                    new_categories=new_categories, ordered=ordered
+                )
+            ),
+        )
 
     def set_categories(
         self,
@@ -627,9 +631,12 @@ class CategoricalIndex(Index):
         if inplace:
             raise ValueError("cannot use inplace with CategoricalIndex")
 
-        return CategoricalIndex(
-            self.to_series().cat.set_categories(new_categories, ordered=ordered, rename=rename)
-        ).rename(self.name)
+        return cast(
+            CategoricalIndex,
+            Index(
+                self.to_series().cat.set_categories(new_categories, ordered=ordered, rename=rename)
+            ),
+        )
 
     def map(  # type: ignore[override]
         self, mapper: Union[dict, Callable[[Any], Any], pd.Series]
@@ -724,6 +731,7 @@ def _test() -> None:
     spark = (
         SparkSession.builder.master("local[4]")
         .appName("pyspark.pandas.indexes.category tests")
+        .config("spark.sql.shuffle.partitions", "4")
         .getOrCreate()
     )
     (failure_count, test_count) = doctest.testmod(
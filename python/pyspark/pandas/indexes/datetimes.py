@@ -135,11 +135,12 @@ class DatetimeIndex(Index):
         return cast(DatetimeIndex, ps.from_pandas(pd.DatetimeIndex(**kwargs)))
 
     def __getattr__(self, item: str) -> Any:
-        if hasattr(MissingPandasLikeDatetimeIndex, item):
-            property_or_func = getattr(MissingPandasLikeDatetimeIndex, item)
+        # Private and dunder probes, e.g., from IPython, are never missing pandas APIs.
+        if not item.startswith("_"):
+            property_or_func = getattr(MissingPandasLikeDatetimeIndex, item, None)
             if isinstance(property_or_func, property):
                 return property_or_func.fget(self)
-            else:
+            elif property_or_func is not None:
                 return partial(property_or_func, self)
         raise AttributeError("'DatetimeIndex' object has no attribute '{}'".format(item))
 
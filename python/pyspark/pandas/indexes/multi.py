@@ -992,11 +992,12 @@ class MultiIndex(Index):
         return False
 
     def __getattr__(self, item: str) -> Any:
-        if hasattr(MissingPandasLikeMultiIndex, item):
-            property_or_func = getattr(MissingPandasLikeMultiIndex, item)
+        # Private and dunder probes, e.g., from IPython, are never missing pandas APIs.
+        if not item.startswith("_"):
+            property_or_func = getattr(MissingPandasLikeMultiIndex, item, None)
             if isinstance(property_or_func, property):
                 return property_or_func.fget(self)
-            else:
+            elif property_or_func is not None:
                 return partial(property_or_func, self)
         raise AttributeError("'MultiIndex' object has no attribute '{}'".format(item))
 
@@ -122,11 +122,12 @@ class TimedeltaIndex(Index):
         return cast(TimedeltaIndex, ps.from_pandas(pd.TimedeltaIndex(**kwargs)))
 
     def __getattr__(self, item: str) -> Any:
-        if hasattr(MissingPandasLikeTimedeltaIndex, item):
-            property_or_func = getattr(MissingPandasLikeTimedeltaIndex, item)
+        # Private and dunder probes, e.g., from IPython, are never missing pandas APIs.
+        if not item.startswith("_"):
+            property_or_func = getattr(MissingPandasLikeTimedeltaIndex, item, None)
             if isinstance(property_or_func, property):
                 return property_or_func.fget(self)
-            else:
+            elif property_or_func is not None:
                 return partial(property_or_func, self)
 
         raise AttributeError("'TimedeltaIndex' object has no attribute '{}'".format(item))
@@ -109,6 +109,16 @@ class IndexesTest(ComparisonTestBase, TestUtils):
         with self.assertRaisesRegex(AttributeError, expected_error_message):
             ps.from_pandas(pd.date_range("2011-01-01", freq="D", periods=10)).__getattr__(item)
 
+        # Private names of the missing-API classes, e.g., `__module__`, are not pandas APIs.
+        for psidx in [
+            ps.CategoricalIndex(["a", "b"]),
+            ps.DatetimeIndex(["2011-01-01", "2011-01-02"]),
+            ps.TimedeltaIndex(["1 days", "2 days"]),
+            ps.MultiIndex.from_tuples([("a", 1), ("b", 2)]),
+        ]:
+            with self.assertRaisesRegex(AttributeError, "object has no attribute '__module__'"):
+                psidx.__getattr__("__module__")
+
     def test_multi_index_getattr(self):
         arrays = [[1, 1, 2, 2], ["red", "blue", "red", "blue"]]
         idx = pd.MultiIndex.from_arrays(arrays, names=("number", "color"))
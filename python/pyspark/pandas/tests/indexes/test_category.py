@@ -98,6 +98,15 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
         with self.assertRaises(ValueError):
             psidx.categories = [1, 2, 3, 4]
 
+        psidx = ps.from_pandas(pd.CategoricalIndex([10, 20, 30], categories=[30, 10, 20]))
+        internal = psidx._psdf._internal
+        psidx.categories = [30, 10, 20]
+        self.assertIs(psidx._psdf._internal, internal)
+        self.assert_eq(psidx.categories, pd.Index([30, 10, 20]))
+        psidx.categories = [30.0, 10.0, 20.0]
+        self.assertIsNot(psidx._psdf._internal, internal)
+        self.assert_eq(psidx.categories, pd.Index([30.0, 10.0, 20.0]))
+
     def test_add_categories(self):
         pidx = pd.CategoricalIndex([1, 2, 3], categories=[3, 2, 1])
         psidx = ps.from_pandas(pidx)
@@ -106,6 +115,11 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
         self.assert_eq(pidx.add_categories([4, 5]), psidx.add_categories([4, 5]))
         self.assert_eq(pidx.add_categories([]), psidx.add_categories([]))
 
+        pidx = pd.CategoricalIndex([1, 2, 3], categories=[3, 2, 1], ordered=True, name="i")
+        psidx = ps.from_pandas(pidx)
+
+        self.assert_eq(pidx.add_categories([4, 5]), psidx.add_categories([4, 5]))
+
         self.assertRaises(ValueError, lambda: psidx.add_categories(4, inplace=True))
         self.assertRaises(ValueError, lambda: psidx.add_categories(3))
         self.assertRaises(ValueError, lambda: psidx.add_categories([4, 4]))
@@ -122,6 +136,12 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
         self.assert_eq(pidx.remove_categories(None), psidx.remove_categories(None))
         self.assert_eq(pidx.remove_categories([None]), psidx.remove_categories([None]))
 
+        pidx = pd.CategoricalIndex([1, 2, None, 3], categories=[3, 2, 1], ordered=True, name="i")
+        psidx = ps.from_pandas(pidx)
+
+        self.assert_eq(pidx.remove_categories(2), psidx.remove_categories(2))
+        self.assert_eq(pidx.remove_categories([3, 1]), psidx.remove_categories([3, 1]))
+
         self.assertRaises(ValueError, lambda: psidx.remove_categories(4, inplace=True))
         self.assertRaises(ValueError, lambda: psidx.remove_categories(4))
         self.assertRaises(ValueError, lambda: psidx.remove_categories([4, None]))
@@ -132,6 +152,11 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
 
         self.assert_eq(pidx.remove_unused_categories(), psidx.remove_unused_categories())
 
+        pidx = pd.CategoricalIndex([1, 4, 5, 3], categories=[4, 3, 2, 1], name="i")
+        psidx = ps.from_pandas(pidx)
+
+        self.assert_eq(pidx.remove_unused_categories(), psidx.remove_unused_categories())
+
         self.assertRaises(ValueError, lambda: psidx.remove_unused_categories(inplace=True))
 
     def test_reorder_categories(self):
@@ -155,6 +180,13 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
         self.assertRaises(ValueError, lambda: psidx.reorder_categories([1, 2, 2]))
         self.assertRaises(TypeError, lambda: psidx.reorder_categories(1))
 
+        pidx = pd.CategoricalIndex([1, 4, 5, 3], categories=[4, 3, 2, 1], name="i")
+        psidx = ps.from_pandas(pidx)
+
+        self.assert_eq(
+            pidx.reorder_categories([1, 2, 3, 4]), psidx.reorder_categories([1, 2, 3, 4])
+        )
+
     def test_as_ordered_unordered(self):
         pidx = pd.CategoricalIndex(["x", "y", "z"], categories=["z", "y", "x"])
         psidx = ps.from_pandas(pidx)
@@ -162,9 +194,29 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
         self.assert_eq(pidx.as_ordered(), psidx.as_ordered())
         self.assert_eq(pidx.as_unordered(), psidx.as_unordered())
 
+        pidx = pd.CategoricalIndex(["x", "y", "z"], categories=["z", "y", "x"], name="i")
+        psidx = ps.from_pandas(pidx)
+
+        self.assert_eq(pidx.as_ordered(), psidx.as_ordered())
+        self.assert_eq(pidx.as_ordered().as_ordered(), psidx.as_ordered().as_ordered())
+        self.assert_eq(pidx.as_unordered(), psidx.as_unordered())
+
         self.assertRaises(ValueError, lambda: psidx.as_ordered(inplace=True))
         self.assertRaises(ValueError, lambda: psidx.as_unordered(inplace=True))
 
+    def test_chained_category_ops(self):
+        pidx = pd.CategoricalIndex(["x", "y", None, "z"], categories=["z", "y", "x"], name="i")
+        psidx = ps.from_pandas(pidx)
+
+        self.assert_eq(
+            pidx.add_categories("w").rename_categories(str.upper).as_ordered(),
+            psidx.add_categories("w").rename_categories(str.upper).as_ordered(),
+        )
+        self.assert_eq(
+            pd.Index(pidx.as_ordered().add_categories(["v", "w"]).as_unordered().codes),
+            psidx.as_ordered().add_categories(["v", "w"]).as_unordered().codes,
+        )
+
     def test_astype(self):
         pidx = pd.Index(["a", "b", "c"])
         psidx = ps.from_pandas(pidx)
@@ -303,6 +355,15 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
             pidx.rename_categories(lambda x: x.upper()),
             psidx.rename_categories(lambda x: x.upper()),
         )
+
+        pidx = pd.CategoricalIndex(["a", "b", None, "d"], ordered=True, name="i")
+        psidx = ps.from_pandas(pidx)
+        self.assert_eq(pidx.rename_categories([0, 1, 2]), psidx.rename_categories([0, 1, 2]))
+        self.assert_eq(
+            pidx.rename_categories({"a": "A", "x": "X"}),
+            psidx.rename_categories({"a": "A", "x": "X"}),
+        )
+        self.assertRaises(ValueError, lambda: psidx.rename_categories([0, 1]))
         self.assertRaises(
             TypeError,
             lambda: psidx.rename_categories(None),
@@ -369,6 +430,11 @@ class CategoricalIndexTest(PandasOnSparkTestCase, TestUtils):
             lambda: psidx.set_categories(["a", "c", "b", "o"], inplace=True),
         )
 
+        pidx = pd.CategoricalIndex([1, 4, 5, 3], categories=[4, 3, 2, 1], name="i")
+        psidx = ps.from_pandas(pidx)
+
+        self.assert_eq(pidx.set_categories([1, 3, 5]), psidx.set_categories([1, 3, 5]))
+
     def test_map(self):
         pidxs = [pd.CategoricalIndex([1, 2, 3]), pd.CategoricalIndex([1, 2, 3], ordered=True)]
         psidxs = [ps.from_pandas(pidx) for pidx in pidxs]